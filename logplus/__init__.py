@@ -6,46 +6,7 @@
 
 from __future__ import annotations
 
-from logplus import (
-    contextvars,
-    dev,
-    processors,
-    stdlib,
-    testing,
-    threadlocal,
-    tracebacks,
-    types,
-    typing,
-)
-from logplus._base import BoundLoggerBase, get_context
-from logplus._config import (
-    configure,
-    configure_once,
-    get_config,
-    get_logger,
-    getLogger,
-    is_configured,
-    reset_defaults,
-    wrap_logger,
-)
-from logplus._generic import BoundLogger
-from logplus._native import make_filtering_bound_logger
-from logplus._output import (
-    BytesLogger,
-    BytesLoggerFactory,
-    PrintLogger,
-    PrintLoggerFactory,
-    WriteLogger,
-    WriteLoggerFactory,
-)
-from logplus.exceptions import DropEvent
-from logplus.testing import ReturnLogger, ReturnLoggerFactory
-
-
-try:
-    from logplus import twisted
-except ImportError:
-    twisted = None  # type: ignore[assignment]
+from typing import Any
 
 
 __title__ = "logplus"
@@ -91,7 +52,75 @@ __all__ = [
 ]
 
 
-def __getattr__(name: str) -> str:
+# Loaded lazily via PEP 562 __getattr__ so that `import logplus` stays
+# cheap for short-lived processes; keep in sync with __all__.
+_LAZY_SUBMODULES = frozenset(
+    {
+        "contextvars",
+        "dev",
+        "exceptions",
+        "processors",
+        "stdlib",
+        "testing",
+        "threadlocal",
+        "tracebacks",
+        "types",
+        "typing",
+    }
+)
+_LAZY_ATTRIBUTES = {
+    "BoundLoggerBase": "logplus._base",
+    "get_context": "logplus._base",
+    "configure": "logplus._config",
+    "configure_once": "logplus._config",
+    "get_config": "logplus._config",
+    "get_logger": "logplus._config",
+    "getLogger": "logplus._config",
+    "is_configured": "logplus._config",
+    "reset_defaults": "logplus._config",
+    "wrap_logger": "logplus._config",
+    "BoundLogger": "logplus._generic",
+    "make_filtering_bound_logger": "logplus._native",
+    "BytesLogger": "logplus._output",
+    "BytesLoggerFactory": "logplus._output",
+    "PrintLogger": "logplus._output",
+    "PrintLoggerFactory": "logplus._output",
+    "WriteLogger": "logplus._output",
+    "WriteLoggerFactory": "logplus._output",
+    "DropEvent": "logplus.exceptions",
+    "ReturnLogger": "logplus.testing",
+    "ReturnLoggerFactory": "logplus.testing",
+}
+
+
+_meta = None
+"""Cached importlib.metadata result for the deprecated dunders."""
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+def __getattr__(name: str) -> Any:
+    from importlib import import_module
+
+    if name in _LAZY_SUBMODULES:
+        # import_module also sets the attribute on the package, so
+        # __getattr__ only runs once per submodule.
+        return import_module(f"logplus.{name}")
+
+    if name in _LAZY_ATTRIBUTES:
+        rv = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = rv
+        return rv
+
+    if name == "twisted":
+        try:
+            return import_module("logplus.twisted")
+        except ImportError:
+            globals()["twisted"] = None
+            return None
+
     import warnings
 
     from importlib.metadata import metadata, version
@@ -115,14 +144,21 @@ def __getattr__(name: str) -> str:
             stacklevel=2,
         )
     else:
-        return version("logplus")
+        rv = version("logplus")
+        globals()[name] = rv
+        return rv
 
-    meta = metadata("logplus")
+    global _meta
+    if _meta is None:
+        # metadata() walks sys.path and parses PKG-INFO; do it once.
+        _meta = metadata("logplus")
 
     if name == "__uri__":
-        return meta["Project-URL"].split(" ", 1)[-1]
-
-    if name == "__email__":
-        return meta["Author-email"].split("<", 1)[1].rstrip(">")
+        rv = _meta["Project-URL"].split(" ", 1)[-1]
+    elif name == "__email__":
+        rv = _meta["Author-email"].split("<", 1)[1].rstrip(">")
+    else:
+        rv = _meta[dunder_to_metadata[name]]
 
-    return meta[dunder_to_metadata[name]]
+    globals()[name] = rv
+    return rv
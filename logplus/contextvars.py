@@ -19,14 +19,14 @@ See :doc:`contextvars`.
 
 from __future__ import annotations
 
-import contextlib
 import contextvars
+import functools
+import sys
 
 from types import FrameType
-from typing import Any, Generator, Mapping
-
-import logplus
+from typing import Any, Callable, Mapping
 
+from ._base import get_context as _get_context
 from .typing import BindableLogger, EventDict, WrappedLogger
 
 
@@ -38,22 +38,50 @@ _ASYNC_CALLING_STACK: contextvars.ContextVar[FrameType] = (
 )
 
 # For proper isolation, we have to use a dict of ContextVars instead of a
-# single ContextVar with a dict.
+# single ContextVar with a dict.  Keyed by the user's key name; the
+# LogPlus_KEY_PREFIX only appears in the ContextVars' own names.
+#
+# The registry only ever grows -- unbinding sets a var back to Ellipsis
+# instead of deleting it -- so ``not _CONTEXT_VARS`` doubles as a cheap,
+# monotone "bind_contextvars was never called" check on the hot paths.
+# A separate boolean flag couldn't be cheaper and couldn't safely be
+# reset, since unbind/clear only affect the calling context.
 _CONTEXT_VARS: dict[str, contextvars.ContextVar[Any]] = {}
 
 
+@functools.cache
+def _make_contextvar(k: str) -> contextvars.ContextVar[Any]:
+    """
+    Create and register the ContextVar for *k*.
+
+    functools.cache may still invoke this more than once when threads
+    race on an uncached key, so the setdefault is what guarantees one
+    ContextVar per key: every racer converges on the registry winner,
+    and that's the var the hot paths iterate and bind.
+    """
+    var = contextvars.ContextVar(f"{LogPlus_KEY_PREFIX}{k}", default=Ellipsis)
+    # Intern the registry key so later lookups -- usually with
+    # already-interned keyword names -- compare by pointer.
+    return _CONTEXT_VARS.setdefault(sys.intern(k), var)
+
+
 def get_contextvars() -> dict[str, Any]:
     """
     Return a copy of the *logplus*-specific context-local context.
 
     .. versionadded:: 21.2.0
     """
-    rv = {}
-    ctx = contextvars.copy_context()
+    if not _CONTEXT_VARS:
+        return {}
 
-    for k in ctx:
-        if k.name.startswith(LogPlus_KEY_PREFIX) and ctx[k] is not Ellipsis:
-            rv[k.name[LogPlus_KEY_PREFIX_LEN:]] = ctx[k]
+    E = Ellipsis
+    rv = {}
+    # list() snapshots the registry so a concurrent first-time bind in
+    # another thread can't resize it mid-iteration.
+    for name, var in list(_CONTEXT_VARS.items()):
+        v = var.get(E)
+        if v is not E:
+            rv[name] = v
 
     return rv
 
@@ -66,13 +94,13 @@ def get_merged_contextvars(bound_logger: BindableLogger) -> dict[str, Any]:
     .. versionadded:: 21.2.0
     """
     ctx = get_contextvars()
-    ctx.update(logplus.get_context(bound_logger))
+    ctx.update(_get_context(bound_logger))
 
     return ctx
 
 
 def merge_contextvars(
-    logger: WrappedLogger, method_name: str, event_dict: EventDict
+    logger: WrappedLogger, method_name: str, event_dict: EventDict, /
 ) -> EventDict:
     """
     A processor that merges in a global (context-local) context.
@@ -83,13 +111,23 @@ def merge_contextvars(
     .. versionadded:: 20.1.0
     .. versionchanged:: 21.1.0 See toplevel note.
     """
-    ctx = contextvars.copy_context()
+    if not _CONTEXT_VARS:
+        return event_dict
 
-    for k in ctx:
-        if k.name.startswith(LogPlus_KEY_PREFIX) and ctx[k] is not Ellipsis:
-            event_dict.setdefault(k.name[LogPlus_KEY_PREFIX_LEN:], ctx[k])
+    E = Ellipsis
+    bound = {}
+    for name, var in list(_CONTEXT_VARS.items()):
+        v = var.get(E)
+        if v is not E:
+            bound[name] = v
 
-    return event_dict
+    if not bound:
+        return event_dict
+
+    # One C-level merge instead of a setdefault() call per bound key;
+    # event_dict values still win.
+    bound.update(event_dict)
+    return bound
 
 
 def clear_contextvars() -> None:
@@ -102,10 +140,11 @@ def clear_contextvars() -> None:
     .. versionadded:: 20.1.0
     .. versionchanged:: 21.1.0 See toplevel note.
     """
-    ctx = contextvars.copy_context()
-    for k in ctx:
-        if k.name.startswith(LogPlus_KEY_PREFIX):
-            k.set(Ellipsis)
+    if not _CONTEXT_VARS:
+        return
+
+    for var in list(_CONTEXT_VARS.values()):
+        var.set(Ellipsis)
 
 
 def bind_contextvars(**kw: Any) -> Mapping[str, contextvars.Token[Any]]:
@@ -125,18 +164,34 @@ def bind_contextvars(**kw: Any) -> Mapping[str, contextvars.Token[Any]]:
     """
     rv = {}
     for k, v in kw.items():
-        logplus_k = f"{LogPlus_KEY_PREFIX}{k}"
-        try:
-            var = _CONTEXT_VARS[logplus_k]
-        except KeyError:
-            var = contextvars.ContextVar(logplus_k, default=Ellipsis)
-            _CONTEXT_VARS[logplus_k] = var
+        var = _CONTEXT_VARS.get(k)
+        if var is None:
+            var = _make_contextvar(k)
 
         rv[k] = var.set(v)
 
     return rv
 
 
+def set_contextvars(**kw: Any) -> None:
+    """
+    Put keys and values into the context-local context, like
+    :func:`bind_contextvars`, but don't build the `contextvars.Token`
+    mapping.
+
+    Useful for fire-and-forget binding on hot paths that never call
+    :func:`reset_contextvars`; it saves a dict allocation per call.
+
+    .. versionadded:: 24.1.0
+    """
+    for k, v in kw.items():
+        var = _CONTEXT_VARS.get(k)
+        if var is None:
+            var = _make_contextvar(k)
+
+        var.set(v)
+
+
 def reset_contextvars(**kw: contextvars.Token[Any]) -> None:
     r"""
     Reset contextvars corresponding to the given Tokens.
@@ -144,9 +199,7 @@ def reset_contextvars(**kw: contextvars.Token[Any]) -> None:
     .. versionadded:: 21.1.0
     """
     for k, v in kw.items():
-        logplus_k = f"{LogPlus_KEY_PREFIX}{k}"
-        var = _CONTEXT_VARS[logplus_k]
-        var.reset(v)
+        _CONTEXT_VARS[k].reset(v)
 
 
 def unbind_contextvars(*keys: str) -> None:
@@ -160,13 +213,43 @@ def unbind_contextvars(*keys: str) -> None:
     .. versionchanged:: 21.1.0 See toplevel note.
     """
     for k in keys:
-        logplus_k = f"{LogPlus_KEY_PREFIX}{k}"
-        if logplus_k in _CONTEXT_VARS:
-            _CONTEXT_VARS[logplus_k].set(Ellipsis)
+        var = _CONTEXT_VARS.get(k)
+        if var is not None:
+            var.set(Ellipsis)
+
 
+class _BoundContextVars:
+    """
+    Context manager / decorator returned by `bound_contextvars`.
 
-@contextlib.contextmanager
-def bound_contextvars(**kw: Any) -> Generator[None, None, None]:
+    A plain class with explicit ``__enter__``/``__exit__`` is about twice
+    as fast to enter as a `contextlib.contextmanager`-wrapped generator.
+    """
+
+    __slots__ = ("_kw", "_tokens")
+
+    def __init__(self, kw: dict[str, Any]):
+        self._kw = kw
+        # A stack, so reusing / nesting the same instance unwinds correctly.
+        self._tokens: list[Mapping[str, contextvars.Token[Any]]] = []
+
+    def __enter__(self) -> None:
+        self._tokens.append(bind_contextvars(**self._kw))
+
+    def __exit__(self, *exc_info: Any) -> None:
+        for k, token in self._tokens.pop().items():
+            _CONTEXT_VARS[k].reset(token)
+
+    def __call__(self, f: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(f)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _BoundContextVars(self._kw):
+                return f(*args, **kwargs)
+
+        return wrapper
+
+
+def bound_contextvars(**kw: Any) -> _BoundContextVars:
     """
     Bind *kw* to the current context-local context. Unbind or restore *kw*
     afterwards. Do **not** affect other keys.
@@ -175,12 +258,4 @@ def bound_contextvars(**kw: Any) -> Generator[None, None, None]:
 
     .. versionadded:: 21.4.0
     """
-    context = get_contextvars()
-    saved = {k: context[k] for k in context.keys() & kw.keys()}
-
-    bind_contextvars(**kw)
-    try:
-        yield
-    finally:
-        unbind_contextvars(*kw.keys())
-        bind_contextvars(**saved)
+    return _BoundContextVars(kw)
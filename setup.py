@@ -8,7 +8,11 @@ with open("README.rst", encoding="utf-8") as readme_file:
 with open("HISTORY.rst", encoding="utf-8") as history_file:
     history = history_file.read()
 
-requirements = [requirement for requirement in open('requirements.txt', encoding="utf-8")]
+requirements = [
+    requirement.strip()
+    for requirement in open('requirements.txt', encoding="utf-8")
+    if requirement.strip() and not requirement.strip().startswith('#')
+]
 
 setup(
     name='logplus',
@@ -25,7 +29,7 @@ setup(
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.7'
+        'Programming Language :: Python :: 3.9'
     ],
     packages=find_packages(include=["logplus", "logplus.*"]),
     install_requires=requirements,
@@ -34,7 +38,7 @@ setup(
             'logplus=logplus.cli:main'
         ]
     },
-    python_requires=">=3.7",
+    python_requires=">=3.9",
     keywords="logplus",
     zip_safe=False
 )
\ No newline at end of file